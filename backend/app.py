@@ -3,6 +3,7 @@ import sys
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 BACKEND_DIR = Path(__file__).resolve().parent
 if str(BACKEND_DIR) not in sys.path:
@@ -13,7 +14,7 @@ from src.settings import ensure_runtime_dirs
 
 ensure_runtime_dirs()
 
-app = FastAPI(title="Legal Tabular Review API")
+app = FastAPI(title="Legal Tabular Review API", default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
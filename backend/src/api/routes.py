@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-import shutil
+import asyncio
 from pathlib import Path
 
+import aiofiles
+
 from fastapi import APIRouter, File, HTTPException, UploadFile
 from fastapi.responses import FileResponse
 
@@ -25,8 +27,8 @@ def list_projects() -> dict[str, list[dict[str, str]]]:
 
 
 @router.get("/documents")
-def list_documents() -> dict[str, list[dict[str, str]]]:
-    docs = inventory.sync_and_list_documents()
+async def list_documents() -> dict[str, list[dict[str, str]]]:
+    docs = await asyncio.to_thread(inventory.sync_and_list_documents)
     return {
         "documents": [
             {
@@ -48,10 +50,11 @@ async def upload_document(file: UploadFile = File(...)) -> dict[str, str]:
         raise HTTPException(status_code=400, detail="Unsupported file type. Use PDF or HTML.")
 
     target = UPLOADS_DIR / (file.filename or "uploaded_document")
-    with target.open("wb") as handle:
-        shutil.copyfileobj(file.file, handle)
+    async with aiofiles.open(target, "wb") as handle:
+        while chunk := await file.read(1 << 20):
+            await handle.write(chunk)
 
-    docs = inventory.sync_and_list_documents()
+    docs = await asyncio.to_thread(inventory.sync_and_list_documents)
     uploaded = next((doc for doc in docs if doc.path == str(target.resolve())), None)
 
     return {
@@ -62,18 +65,19 @@ async def upload_document(file: UploadFile = File(...)) -> dict[str, str]:
 
 
 @router.post("/runs")
-def run_extraction(request: RunRequest) -> dict:
-    job_id = run_service.create_job(
-        mode=request.mode,
-        options={"template_path": request.template_path, "wait": request.wait},
+async def run_extraction(request: RunRequest) -> dict:
+    job_id = await asyncio.to_thread(
+        run_service.create_job,
+        request.mode,
+        {"template_path": request.template_path, "wait": request.wait},
     )
 
     if request.wait:
-        run_service.run_job_sync(job_id, request.mode, request.template_path)
+        await asyncio.to_thread(run_service.run_job_sync, job_id, request.mode, request.template_path)
     else:
         run_service.run_job_async(job_id, request.mode, request.template_path)
 
-    job = run_service.get_job(job_id)
+    job = await asyncio.to_thread(run_service.get_job, job_id)
     if not job:
         raise HTTPException(status_code=500, detail="Failed to create extraction job")
     return {"job": job}
@@ -88,8 +92,8 @@ def get_job(job_id: str) -> dict:
 
 
 @router.get("/results/table")
-def get_table(job_id: str | None = None) -> dict:
-    return run_service.get_table_payload(job_id)
+async def get_table(job_id: str | None = None) -> dict:
+    return await asyncio.to_thread(run_service.get_table_payload, job_id)
 
 
 @router.patch("/cells/{cell_id}")
@@ -117,14 +121,14 @@ def get_cell_audit(cell_id: str) -> dict:
 
 
 @router.post("/exports/csv")
-def export_csv(request: ExportRequest) -> FileResponse:
-    path = export_service.export_csv(request.job_id)
+async def export_csv(request: ExportRequest) -> FileResponse:
+    path = await asyncio.to_thread(export_service.export_csv, request.job_id)
     return FileResponse(path, media_type="text/csv", filename=path.name)
 
 
 @router.post("/exports/xlsx")
-def export_xlsx(request: ExportRequest) -> FileResponse:
-    path = export_service.export_xlsx(request.job_id)
+async def export_xlsx(request: ExportRequest) -> FileResponse:
+    path = await asyncio.to_thread(export_service.export_xlsx, request.job_id)
     return FileResponse(
         path,
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
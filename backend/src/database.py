@@ -8,10 +8,17 @@ from typing import Any, Iterator
 from .settings import DB_PATH, ensure_runtime_dirs
 
 
-SCHEMA_SQL = """
+PRAGMA_SQL = """
 PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
 PRAGMA foreign_keys=ON;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA cache_size=-65536;
+PRAGMA wal_autocheckpoint=1000;
+"""
 
+SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS documents (
     id TEXT PRIMARY KEY,
     identifier TEXT NOT NULL,
@@ -55,6 +62,8 @@ CREATE TABLE IF NOT EXISTS cells (
 
 CREATE INDEX IF NOT EXISTS idx_cells_job_field ON cells(job_id, field_key);
 CREATE INDEX IF NOT EXISTS idx_cells_job_doc ON cells(job_id, document_id);
+CREATE INDEX IF NOT EXISTS idx_cells_job_updated ON cells(job_id, updated_at DESC);
+CREATE INDEX IF NOT EXISTS idx_cells_job_field_doc ON cells(job_id, field_key, document_identifier);
 
 CREATE TABLE IF NOT EXISTS audit_logs (
     id TEXT PRIMARY KEY,
@@ -78,17 +87,39 @@ class SQLiteStore:
     def __init__(self) -> None:
         ensure_runtime_dirs()
         self._lock = threading.Lock()
+        self._local = threading.local()
         self._init_schema()
 
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(DB_PATH), check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.executescript(PRAGMA_SQL)
+            self._local.conn = conn
+        return conn
+
     @contextmanager
     def connect(self) -> Iterator[sqlite3.Connection]:
-        conn = sqlite3.connect(str(DB_PATH), check_same_thread=False)
-        conn.row_factory = sqlite3.Row
+        conn = self._connection()
         try:
             yield conn
             conn.commit()
-        finally:
-            conn.close()
+        except Exception:
+            conn.rollback()
+            raise
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except Exception:
+                conn.rollback()
+                raise
+            conn.commit()
 
     def _init_schema(self) -> None:
         with self.connect() as conn:
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Iterator
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentRecord:
     id: str
     identifier: str
@@ -12,7 +13,7 @@ class DocumentRecord:
     kind: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TextChunk:
     document_id: str
     location_type: str
@@ -20,7 +21,61 @@ class TextChunk:
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
+class ChunkBatch:
+    """Structure-of-arrays layout for one document's text chunks.
+
+    The extraction hot loop only touches `texts` and `location_values`, so
+    keeping them as flat parallel lists avoids chasing a `TextChunk` object
+    per iteration. `chunk_at` materializes a `TextChunk` view on demand for
+    callers that need the per-chunk record (citations, tests).
+    """
+
+    document_id: str
+    location_types: list[str] = field(default_factory=list)
+    location_values: list[str] = field(default_factory=list)
+    texts: list[str] = field(default_factory=list)
+    texts_lower: list[str | None] = field(default_factory=list)
+
+    @classmethod
+    def from_chunks(cls, chunks: list[TextChunk]) -> ChunkBatch:
+        batch = cls(document_id=chunks[0].document_id if chunks else "")
+        for chunk in chunks:
+            batch.append(chunk.location_type, chunk.location_value, chunk.text)
+        return batch
+
+    def append(self, location_type: str, location_value: str, text: str) -> None:
+        self.location_types.append(location_type)
+        self.location_values.append(location_value)
+        self.texts.append(text)
+        self.texts_lower.append(None)
+
+    def text_lower(self, index: int) -> str:
+        """Lowercased chunk text, computed once and shared across fields."""
+        cached = self.texts_lower[index]
+        if cached is None:
+            cached = self.texts_lower[index] = self.texts[index].lower()
+        return cached
+
+    def chunk_at(self, index: int) -> TextChunk:
+        return TextChunk(
+            document_id=self.document_id,
+            location_type=self.location_types[index],
+            location_value=self.location_values[index],
+            text=self.texts[index],
+        )
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __iter__(self) -> Iterator[TextChunk]:
+        return (self.chunk_at(index) for index in range(len(self.texts)))
+
+    def __getitem__(self, index: int) -> TextChunk:
+        return self.chunk_at(index)
+
+
+@dataclass(slots=True)
 class NormalizationResult:
     value: str | None
     success: bool
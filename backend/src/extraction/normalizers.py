@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, datetime
+from functools import lru_cache
 import re
 from dateutil import parser as date_parser
 
@@ -10,30 +11,75 @@ from ..utils import compact_whitespace
 
 CURRENCY_PATTERN = re.compile(r"(?P<symbol>\$)?\s*(?P<amount>[0-9]{1,3}(?:,[0-9]{3})*(?:\.[0-9]+)?)")
 
+_NO_COMMAS = str.maketrans("", "", ",")
 
-def normalize_text(value: str) -> NormalizationResult:
+# Formats that cover the vast majority of dates in legal filings; anything else
+# falls through to dateutil's (much slower) fuzzy parser.
+FAST_DATE_FORMATS = (
+    "%B %d, %Y",
+    "%b %d, %Y",
+    "%Y-%m-%d",
+    "%m/%d/%Y",
+    "%d %B %Y",
+)
+
+
+# Parsing is memoized per normalizer on the raw string (cached values are
+# plain strings/None, never NormalizationResult instances, so entries stay
+# immutable) and the public functions build a fresh result each call. The
+# same candidate strings recur across documents, so repeats skip the parse.
+
+
+@lru_cache(maxsize=16384)
+def _clean_text(value: str) -> str | None:
     cleaned = compact_whitespace(value)
-    return NormalizationResult(value=cleaned if cleaned else None, success=bool(cleaned), reason="text_cleanup")
+    return cleaned if cleaned else None
 
 
-def normalize_date(value: str) -> NormalizationResult:
+def normalize_text(value: str) -> NormalizationResult:
+    cleaned = _clean_text(value)
+    return NormalizationResult(value=cleaned, success=cleaned is not None, reason="text_cleanup")
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(value: str) -> str | None:
+    stripped = value.strip()
+    for fmt in FAST_DATE_FORMATS:
+        try:
+            return datetime.strptime(stripped, fmt).date().isoformat()
+        except ValueError:
+            continue
+
     try:
         parsed = date_parser.parse(value, fuzzy=True, dayfirst=False).date()
-        if not isinstance(parsed, date):
-            return NormalizationResult(value=None, success=False, reason="date_parse_failed")
-        return NormalizationResult(value=parsed.isoformat(), success=True, reason="date_parsed")
     except (ValueError, OverflowError):
+        return None
+    if not isinstance(parsed, date):
+        return None
+    return parsed.isoformat()
+
+
+def normalize_date(value: str) -> NormalizationResult:
+    parsed = _parse_date(value)
+    if parsed is None:
         return NormalizationResult(value=None, success=False, reason="date_parse_failed")
+    return NormalizationResult(value=parsed, success=True, reason="date_parsed")
 
 
-def normalize_currency(value: str) -> NormalizationResult:
+@lru_cache(maxsize=4096)
+def _parse_currency(value: str) -> str | None:
     match = CURRENCY_PATTERN.search(value)
     if not match:
-        return NormalizationResult(value=None, success=False, reason="currency_parse_failed")
-
-    amount = match.group("amount").replace(",", "")
+        return None
+    amount = match.group("amount").translate(_NO_COMMAS)
     symbol = match.group("symbol") or ""
-    normalized = f"{symbol}{amount}"
+    return f"{symbol}{amount}"
+
+
+def normalize_currency(value: str) -> NormalizationResult:
+    normalized = _parse_currency(value)
+    if normalized is None:
+        return NormalizationResult(value=None, success=False, reason="currency_parse_failed")
     return NormalizationResult(value=normalized, success=True, reason="currency_parsed")
 
 
@@ -45,5 +91,4 @@ NORMALIZERS = {
 
 
 def normalize_value(value: str, normalizer_name: str) -> NormalizationResult:
-    normalizer = NORMALIZERS.get(normalizer_name, normalize_text)
-    return normalizer(value)
+    return NORMALIZERS.get(normalizer_name, normalize_text)(value)
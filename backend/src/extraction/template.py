@@ -1,14 +1,60 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 import json
 from pathlib import Path
+import re
+from typing import Any
+
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - optional accelerator
+    hyperscan = None
+
+
+@lru_cache(maxsize=64)
+def _build_hyperscan_database(patterns: tuple[str, ...]) -> Any | None:
+    if hyperscan is None or not patterns:
+        return None
+
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_SINGLEMATCH
+    database = hyperscan.Database()
+    try:
+        database.compile(
+            expressions=[pattern.encode("utf-8") for pattern in patterns],
+            ids=list(range(len(patterns))),
+            flags=[flags] * len(patterns),
+        )
+    except hyperscan.error:
+        return None
+    return database
 
 
 @dataclass
 class FieldSearchConfig:
     patterns: list[str]
     join_groups: bool = False
+    compiled: list[re.Pattern[str]] = field(default_factory=list)
+    hs_database: Any | None = None
+
+    def __post_init__(self) -> None:
+        if not self.compiled:
+            self.compiled = [re.compile(pattern, flags=re.IGNORECASE | re.MULTILINE) for pattern in self.patterns]
+        if self.hs_database is None:
+            self.hs_database = _build_hyperscan_database(tuple(self.patterns))
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Hyperscan databases are not picklable; worker processes rebuild them
+        # through the memoized compile cache.
+        return {"patterns": self.patterns, "join_groups": self.join_groups}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.patterns = state["patterns"]
+        self.join_groups = state["join_groups"]
+        self.compiled = []
+        self.hs_database = None
+        self.__post_init__()
 
 
 @dataclass
@@ -19,6 +65,20 @@ class FieldTemplate:
     normalizer: str
     hints: list[str]
     search: FieldSearchConfig
+    hint_lookup: frozenset[str] = frozenset()
+    hint_regex: re.Pattern[str] | None = None
+
+    def __post_init__(self) -> None:
+        if not self.hint_lookup:
+            self.hint_lookup = frozenset(hint.lower() for hint in self.hints if hint)
+        if self.hint_regex is None and self.hint_lookup:
+            # One compiled alternation over the deduplicated, lowercased hints:
+            # a single linear scan of the text replaces a per-hint substring
+            # search, with longer hints tried first for determinism. Callers
+            # match against pre-lowercased text, so IGNORECASE (and its
+            # per-character case folding) is not needed.
+            alternation = "|".join(re.escape(hint) for hint in sorted(self.hint_lookup, key=len, reverse=True))
+            self.hint_regex = re.compile(alternation)
 
 
 @dataclass
@@ -27,9 +87,27 @@ class ExtractionTemplate:
     status: str
     description: str
     fields: list[FieldTemplate]
+    field_order: dict[str, int] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not self.field_order:
+            self.field_order = {field_template.key: index for index, field_template in enumerate(self.fields)}
+
+    @cached_property
+    def fields_by_key(self) -> dict[str, FieldTemplate]:
+        return {field_template.key: field_template for field_template in self.fields}
 
 
 def load_template(path: str | Path) -> ExtractionTemplate:
+    template_path = Path(path)
+    return _load_template_cached(str(template_path), template_path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=16)
+def _load_template_cached(path: str, mtime_ns: int) -> ExtractionTemplate:
+    # mtime in the key means an edited template file reloads on next access
+    # while steady-state callers (every table fetch and job run) reuse the
+    # parsed object, compiled patterns included.
     template_path = Path(path)
     payload = json.loads(template_path.read_text(encoding="utf-8"))
     fields = []
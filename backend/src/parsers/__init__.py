@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from ..domain import DocumentRecord, TextChunk
+from ..domain import ChunkBatch, DocumentRecord
 from .html_parser import parse_html
 from .pdf_parser import parse_pdf
 
 
-def parse_document(document: DocumentRecord, max_pages: int | None = None) -> list[TextChunk]:
+def parse_document(document: DocumentRecord, max_pages: int | None = None) -> ChunkBatch:
     if document.kind == "pdf":
         return parse_pdf(document, max_pages=max_pages)
     if document.kind in {"html", "htm"}:
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from ..domain import ChunkBatch
+from ..settings import ARTIFACTS_DIR
+
+PARSE_CACHE_DIR = ARTIFACTS_DIR / "parse_cache"
+
+# Maps (path, mtime_ns, size) -> content digest so an unchanged file is hashed
+# at most once per process; a touched or rewritten file falls through to a
+# fresh digest, which keys a new cache entry.
+_digest_memo: dict[tuple[str, int, int], str] = {}
+
+
+def _content_digest(path: str) -> str:
+    stat = os.stat(path)
+    memo_key = (path, stat.st_mtime_ns, stat.st_size)
+    digest = _digest_memo.get(memo_key)
+    if digest is None:
+        with open(path, "rb") as handle:
+            digest = hashlib.file_digest(handle, "sha1").hexdigest()
+        _digest_memo[memo_key] = digest
+    return digest
+
+
+def _cache_path(document_path: str, max_pages: int | None) -> Path:
+    suffix = str(max_pages) if max_pages else "all"
+    return PARSE_CACHE_DIR / f"{_content_digest(document_path)}_{suffix}.json"
+
+
+def load_cached_batch(document_path: str, document_id: str, max_pages: int | None = None) -> ChunkBatch | None:
+    try:
+        payload = json.loads(_cache_path(document_path, max_pages).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError, KeyError):
+        return None
+
+    batch = ChunkBatch(document_id=document_id)
+    try:
+        for entry in payload["chunks"]:
+            batch.append(entry["location_type"], entry["location_value"], entry["text"])
+    except (KeyError, TypeError):
+        return None
+    return batch
+
+
+def store_cached_batch(document_path: str, batch: ChunkBatch, max_pages: int | None = None) -> None:
+    payload = {
+        "chunks": [
+            {"location_type": location_type, "location_value": location_value, "text": text}
+            for location_type, location_value, text in zip(batch.location_types, batch.location_values, batch.texts)
+        ]
+    }
+    try:
+        PARSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _cache_path(document_path, max_pages).write_text(json.dumps(payload, ensure_ascii=True), encoding="utf-8")
+    except OSError:
+        # Cache writes are best-effort; extraction already succeeded.
+        pass
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from functools import lru_cache
 import hashlib
+import os
 from pathlib import Path
 
 from ..database import store
@@ -11,27 +13,38 @@ from ..utils import utc_now_iso
 SUPPORTED_EXTENSIONS = {".pdf", ".html", ".htm"}
 
 
-def _build_document_id(path: Path) -> str:
-    digest = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()
+@lru_cache(maxsize=4096)
+def _build_document_id(resolved_path: str) -> str:
+    # IDs derive from the resolved path, which never changes for a directory
+    # entry, so the digest is memoized across the frequent inventory rescans.
+    digest = hashlib.sha1(resolved_path.encode("utf-8")).hexdigest()
     return digest[:16]
 
 
 def _scan_directory(directory: Path, source: str) -> list[DocumentRecord]:
-    if not directory.exists():
+    try:
+        with os.scandir(directory) as entries:
+            selected = [
+                entry
+                for entry in entries
+                if entry.is_file() and os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS
+            ]
+    except FileNotFoundError:
         return []
 
+    selected.sort(key=lambda entry: entry.name)
+
     records: list[DocumentRecord] = []
-    for path in sorted(directory.glob("*")):
-        if not path.is_file():
-            continue
-        suffix = path.suffix.lower()
-        if suffix not in SUPPORTED_EXTENSIONS:
-            continue
+    for entry in selected:
+        suffix = os.path.splitext(entry.name)[1].lower()
+        # The scan roots come from resolved settings paths, so entry.path is
+        # already canonical unless the entry itself is a symlink.
+        resolved = os.path.realpath(entry.path) if entry.is_symlink() else entry.path
         records.append(
             DocumentRecord(
-                id=_build_document_id(path),
-                identifier=path.name,
-                path=str(path.resolve()),
+                id=_build_document_id(resolved),
+                identifier=entry.name,
+                path=resolved,
                 source=source,
                 kind=suffix.lstrip("."),
             )
@@ -5,6 +5,7 @@ from typing import Any
 
 from ..database import store
 from ..utils import to_json, utc_now_iso
+from .run_service import invalidate_table_payload_cache
 
 
 ALLOWED_REVIEW_STATES = {"CONFIRMED", "REJECTED", "MANUAL_UPDATED", "MISSING_DATA"}
@@ -17,65 +18,71 @@ def update_cell(
     manual_value: str | None = None,
     reason: str | None = None,
 ) -> dict[str, Any] | None:
-    row = store.fetchone("SELECT * FROM cells WHERE id = ?", (cell_id,))
-    if row is None:
-        return None
+    # One transaction for the whole review click: read, update (RETURNING the
+    # fresh row), and audit commit together instead of as four autocommits.
+    with store.transaction() as conn:
+        row = conn.execute("SELECT * FROM cells WHERE id = ?", (cell_id,)).fetchone()
+        if row is None:
+            return None
 
-    old_value = row["value_normalized"] or row["value_raw"]
-    old_review_state = row["review_state"]
+        old_value = row["value_normalized"] or row["value_raw"]
+        old_review_state = row["review_state"]
 
-    next_review_state = review_state or row["review_state"]
-    next_raw = row["value_raw"]
-    next_normalized = row["value_normalized"]
+        next_review_state = review_state or row["review_state"]
+        next_raw = row["value_raw"]
+        next_normalized = row["value_normalized"]
 
-    if manual_value is not None:
-        next_raw = manual_value
-        next_normalized = manual_value
-        next_review_state = "MANUAL_UPDATED"
+        if manual_value is not None:
+            next_raw = manual_value
+            next_normalized = manual_value
+            next_review_state = "MANUAL_UPDATED"
 
-    if next_review_state not in ALLOWED_REVIEW_STATES:
-        raise ValueError(f"Invalid review_state: {next_review_state}")
+        if next_review_state not in ALLOWED_REVIEW_STATES:
+            raise ValueError(f"Invalid review_state: {next_review_state}")
 
-    now = utc_now_iso()
+        now = utc_now_iso()
 
-    meta = {
-        "manual_update": manual_value is not None,
-        "reason": reason,
-    }
-
-    store.execute(
-        """
-        UPDATE cells
-        SET value_raw = ?, value_normalized = ?, review_state = ?, extraction_meta_json = ?, updated_at = ?
-        WHERE id = ?
-        """,
-        (next_raw, next_normalized, next_review_state, to_json(meta), now, cell_id),
-    )
+        meta = {
+            "manual_update": manual_value is not None,
+            "reason": reason,
+        }
 
-    store.execute(
-        """
-        INSERT INTO audit_logs (
-            id, cell_id, action, actor, old_value, new_value, old_review_state, new_review_state, reason, created_at
+        updated = conn.execute(
+            """
+            UPDATE cells
+            SET value_raw = ?, value_normalized = ?, review_state = ?, extraction_meta_json = ?, updated_at = ?
+            WHERE id = ?
+            RETURNING *
+            """,
+            (next_raw, next_normalized, next_review_state, to_json(meta), now, cell_id),
+        ).fetchone()
+        if updated is None:
+            return None
+
+        conn.execute(
+            """
+            INSERT INTO audit_logs (
+                id, cell_id, action, actor, old_value, new_value, old_review_state, new_review_state, reason, created_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                uuid.uuid4().hex,
+                cell_id,
+                "CELL_UPDATED",
+                actor,
+                old_value,
+                next_normalized or next_raw,
+                old_review_state,
+                next_review_state,
+                reason,
+                now,
+            ),
         )
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            uuid.uuid4().hex,
-            cell_id,
-            "CELL_UPDATED",
-            actor,
-            old_value,
-            next_normalized or next_raw,
-            old_review_state,
-            next_review_state,
-            reason,
-            now,
-        ),
-    )
 
-    updated = store.fetchone("SELECT * FROM cells WHERE id = ?", (cell_id,))
-    if updated is None:
-        return None
+    # updated_at has second resolution, so a same-second edit would not bump the
+    # payload cache version on its own.
+    invalidate_table_payload_cache(row["job_id"])
 
     return {
         "cell_id": updated["id"],
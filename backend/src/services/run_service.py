@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+import sqlite3
 import threading
 import uuid
 from typing import Any
@@ -78,32 +80,40 @@ def _set_job_completed(job_id: str) -> None:
     )
 
 
-def _insert_cells(job_id: str, document: DocumentRecord, results: list[ExtractionResult]) -> None:
+def _insert_cells_bulk(
+    conn: sqlite3.Connection,
+    job_id: str,
+    pairs: list[tuple[DocumentRecord, list[ExtractionResult]]],
+) -> None:
     now = utc_now_iso()
     rows = []
-    for result in results:
-        rows.append(
-            (
-                uuid.uuid4().hex,
-                job_id,
-                result.field_key,
-                result.field_label,
-                result.field_type,
-                document.id,
-                document.identifier,
-                result.value_raw,
-                result.value_normalized,
-                result.confidence,
-                to_json(result.confidence_reasons),
-                result.review_state,
-                to_json(result.citation),
-                to_json(result.extraction_meta),
-                now,
-                now,
+    for document, results in pairs:
+        for result in results:
+            rows.append(
+                (
+                    uuid.uuid4().hex,
+                    job_id,
+                    result.field_key,
+                    result.field_label,
+                    result.field_type,
+                    document.id,
+                    document.identifier,
+                    result.value_raw,
+                    result.value_normalized,
+                    result.confidence,
+                    to_json(result.confidence_reasons),
+                    result.review_state,
+                    to_json(result.citation),
+                    to_json(result.extraction_meta),
+                    now,
+                    now,
+                )
             )
-        )
 
-    store.executemany(
+    if not rows:
+        return
+
+    conn.executemany(
         """
         INSERT INTO cells (
             id, job_id, field_key, field_label, field_type, document_id, document_identifier,
@@ -116,31 +126,51 @@ def _insert_cells(job_id: str, document: DocumentRecord, results: list[Extractio
     )
 
 
-def _extract_for_document(document: DocumentRecord, mode: str, fields: list[Any]) -> list[ExtractionResult]:
-    max_pages = 3 if mode == "quick" and document.kind == "pdf" else None
+def _page_limit(document: DocumentRecord, mode: str) -> int | None:
+    return 3 if mode == "quick" and document.kind == "pdf" else None
+
+
+def _parse_failure_results(fields: list[Any], exc: Exception) -> list[ExtractionResult]:
+    return [
+        ExtractionResult(
+            field_key=field.key,
+            field_label=field.label,
+            field_type=field.field_type,
+            value_raw=None,
+            value_normalized=None,
+            confidence=0.0,
+            confidence_reasons=["parse_failed"],
+            review_state="MISSING_DATA",
+            citation=None,
+            extraction_meta={"error": str(exc)},
+        )
+        for field in fields
+    ]
+
 
+def _extract_for_document(document: DocumentRecord, mode: str, fields: list[Any]) -> list[ExtractionResult]:
     try:
-        chunks = parse_document(document, max_pages=max_pages)
+        chunks = parse_document(document, max_pages=_page_limit(document, mode))
     except Exception as exc:  # noqa: BLE001
-        return [
-            ExtractionResult(
-                field_key=field.key,
-                field_label=field.label,
-                field_type=field.field_type,
-                value_raw=None,
-                value_normalized=None,
-                confidence=0.0,
-                confidence_reasons=["parse_failed"],
-                review_state="MISSING_DATA",
-                citation=None,
-                extraction_meta={"error": str(exc)},
-            )
-            for field in fields
-        ]
+        return _parse_failure_results(fields, exc)
 
     return [extract_field(field, document, chunks) for field in fields]
 
 
+def _extract_documents(selected_documents: list[DocumentRecord], mode: str, fields: list[Any]) -> list[tuple[DocumentRecord, list[ExtractionResult]]]:
+    if len(selected_documents) <= 1:
+        return [(document, _extract_for_document(document, mode, fields)) for document in selected_documents]
+
+    # Documents are independent, and the parser/regex layers spend most of
+    # their time in C code that releases the GIL, so threads scale here
+    # without the pickling overhead a process pool would add per task.
+    with ThreadPoolExecutor(max_workers=min(8, len(selected_documents))) as executor:
+        futures = [
+            executor.submit(_extract_for_document, document, mode, fields) for document in selected_documents
+        ]
+        return [(document, future.result()) for document, future in zip(selected_documents, futures)]
+
+
 def run_job_sync(job_id: str, mode: str, template_path: str | None = None) -> None:
     _set_job_running(job_id)
 
@@ -155,12 +185,13 @@ def run_job_sync(job_id: str, mode: str, template_path: str | None = None) -> No
         template = load_template(effective_template_path)
         fields = template.fields[:5] if mode == "quick" else template.fields
 
-        store.execute("DELETE FROM cells WHERE job_id = ?", (job_id,))
+        extracted_pairs = _extract_documents(selected_documents, mode, fields)
 
-        for document in selected_documents:
-            extracted = _extract_for_document(document, mode, fields)
-            _insert_cells(job_id, document, extracted)
+        with store.transaction() as conn:
+            conn.execute("DELETE FROM cells WHERE job_id = ?", (job_id,))
+            _insert_cells_bulk(conn, job_id, extracted_pairs)
 
+        invalidate_table_payload_cache(job_id)
         _set_job_completed(job_id)
     except Exception as exc:  # noqa: BLE001
         _set_job_failed(job_id, str(exc))
@@ -200,6 +231,51 @@ def _row_to_cell(row: Any) -> dict[str, Any]:
     }
 
 
+_MISSING_CELL_TEMPLATE: dict[str, Any] = {
+    "cell_id": None,
+    "document_id": None,
+    "document_identifier": None,
+    "value": None,
+    "value_raw": None,
+    "value_normalized": None,
+    "review_state": "MISSING_DATA",
+    "confidence": 0.0,
+    "confidence_reasons": ["missing"],
+    "citation": None,
+    "extraction_meta": {},
+}
+
+
+def _missing_cell(document_id: str, document_identifier: str) -> dict[str, Any]:
+    cell = _MISSING_CELL_TEMPLATE.copy()
+    cell["document_id"] = document_id
+    cell["document_identifier"] = document_identifier
+    cell["confidence_reasons"] = ["missing"]
+    cell["extraction_meta"] = {}
+    return cell
+
+
+_TABLE_PAYLOAD_CACHE: dict[str, tuple[str, dict[str, Any]]] = {}
+_TABLE_PAYLOAD_CACHE_SIZE = 16
+
+
+def _cells_version(job_id: str) -> str | None:
+    row = store.fetchone(
+        "SELECT MAX(updated_at) AS latest, COUNT(*) AS total FROM cells WHERE job_id = ?",
+        (job_id,),
+    )
+    if row is None or not row["total"]:
+        return None
+    return f"{row['latest']}|{row['total']}"
+
+
+def invalidate_table_payload_cache(job_id: str | None = None) -> None:
+    if job_id is None:
+        _TABLE_PAYLOAD_CACHE.clear()
+    else:
+        _TABLE_PAYLOAD_CACHE.pop(job_id, None)
+
+
 def _resolve_template_for_payload(job_id: str | None) -> ExtractionTemplate:
     template_path = str(DEFAULT_TEMPLATE_PATH)
     if job_id:
@@ -213,8 +289,15 @@ def _resolve_template_for_payload(job_id: str | None) -> ExtractionTemplate:
 
 def get_table_payload(job_id: str | None = None) -> dict[str, Any]:
     effective_job_id = job_id or get_latest_completed_job_id()
+
+    version = _cells_version(effective_job_id) if effective_job_id else None
+    if version is not None:
+        cached = _TABLE_PAYLOAD_CACHE.get(effective_job_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
     template = _resolve_template_for_payload(effective_job_id)
-    field_order_map = {field.key: index for index, field in enumerate(template.fields)}
+    field_order_map = template.field_order
 
     if not effective_job_id:
         return {
@@ -225,12 +308,17 @@ def get_table_payload(job_id: str | None = None) -> dict[str, Any]:
         }
 
     job = get_job(effective_job_id)
+    # Fetch only the columns the payload needs, ordered so the index on
+    # (job_id, field_key, document_identifier) drives both the lookup and the
+    # row order; per-field document order matches the old identifier sort.
     rows = store.fetchall(
         """
-        SELECT *
+        SELECT id, field_key, field_label, field_type, document_id, document_identifier,
+               value_raw, value_normalized, confidence, confidence_reasons_json,
+               review_state, citation_json, extraction_meta_json
         FROM cells
         WHERE job_id = ?
-        ORDER BY document_identifier ASC
+        ORDER BY field_key ASC, document_identifier ASC
         """,
         (effective_job_id,),
     )
@@ -243,72 +331,49 @@ def get_table_payload(job_id: str | None = None) -> dict[str, Any]:
             "rows": [],
         }
 
-    documents: list[dict[str, Any]] = []
-    document_ids: list[str] = []
-    fields: list[dict[str, Any]] = []
-    field_keys: list[str] = []
-
-    for row in rows:
-        if row["document_id"] not in document_ids:
-            document_ids.append(row["document_id"])
-            documents.append(
-                {
-                    "id": row["document_id"],
-                    "identifier": row["document_identifier"],
-                }
-            )
-
-        if row["field_key"] not in field_keys:
-            field_keys.append(row["field_key"])
-            fields.append(
-                {
-                    "key": row["field_key"],
-                    "label": row["field_label"],
-                    "type": row["field_type"],
-                }
-            )
-
-    fields.sort(key=lambda item: field_order_map.get(item["key"], 9999))
-
+    # One pass over the result set: dicts double as insertion-ordered sets for
+    # documents/fields while the cell map fills in.
+    document_identifiers: dict[str, str] = {}
+    field_meta: dict[str, tuple[str, str]] = {}
     cell_map: dict[tuple[str, str], dict[str, Any]] = {}
+
     for row in rows:
         cell_map[(row["field_key"], row["document_id"])] = _row_to_cell(row)
+        document_identifiers.setdefault(row["document_id"], row["document_identifier"])
+        field_meta.setdefault(row["field_key"], (row["field_label"], row["field_type"]))
+
+    documents = [
+        {"id": document_id, "identifier": identifier} for document_id, identifier in document_identifiers.items()
+    ]
+    fields = [
+        {"key": key, "label": label, "type": field_type} for key, (label, field_type) in field_meta.items()
+    ]
+    fields.sort(key=lambda item: field_order_map.get(item["key"], 9999))
 
-    table_rows: list[dict[str, Any]] = []
-    for field in fields:
-        cells = []
-        for document in documents:
-            key = (field["key"], document["id"])
-            cell = cell_map.get(
-                key,
-                {
-                    "cell_id": None,
-                    "document_id": document["id"],
-                    "document_identifier": document["identifier"],
-                    "value": None,
-                    "value_raw": None,
-                    "value_normalized": None,
-                    "review_state": "MISSING_DATA",
-                    "confidence": 0.0,
-                    "confidence_reasons": ["missing"],
-                    "citation": None,
-                    "extraction_meta": {},
-                },
-            )
-            cells.append(cell)
-
-        table_rows.append(
-            {
-                "field_key": field["key"],
-                "field_label": field["label"],
-                "field_type": field["type"],
-                "cells": cells,
-            }
-        )
+    table_rows = [
+        {
+            "field_key": field["key"],
+            "field_label": field["label"],
+            "field_type": field["type"],
+            "cells": [
+                cell_map.get((field["key"], document["id"]))
+                or _missing_cell(document["id"], document["identifier"])
+                for document in documents
+            ],
+        }
+        for field in fields
+    ]
 
-    return {
+    payload = {
         "job": job,
         "documents": documents,
         "fields": fields,
         "rows": table_rows,
     }
+
+    if version is not None:
+        while len(_TABLE_PAYLOAD_CACHE) >= _TABLE_PAYLOAD_CACHE_SIZE:
+            _TABLE_PAYLOAD_CACHE.pop(next(iter(_TABLE_PAYLOAD_CACHE)))
+        _TABLE_PAYLOAD_CACHE[effective_job_id] = (version, payload)
+
+    return payload
@@ -1,24 +1,36 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
-import json
+from functools import lru_cache
+import time
 from typing import Any
 
+import orjson
+
 
 def utc_now_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    # Same shape as datetime.now(timezone.utc).isoformat() at second
+    # resolution, without allocating datetime/timezone objects per call.
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
 
 
 def to_json(value: Any) -> str:
-    return json.dumps(value, ensure_ascii=True)
+    return orjson.dumps(value).decode()
+
+
+@lru_cache(maxsize=8192)
+def _loads(raw: str) -> Any:
+    # Identical JSON strings (missing-cell citations, repeated metadata)
+    # recur across rows; parse each distinct string once. Callers must treat
+    # the returned objects as read-only since cache hits share them.
+    return orjson.loads(raw)
 
 
 def from_json(raw: str | None, default: Any) -> Any:
     if not raw:
         return default
     try:
-        return json.loads(raw)
-    except json.JSONDecodeError:
+        return _loads(raw)
+    except orjson.JSONDecodeError:
         return default
 
 
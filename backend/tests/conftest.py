@@ -3,8 +3,19 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 REPO_ROOT = Path(__file__).resolve().parents[2]
 BACKEND_DIR = REPO_ROOT / "backend"
 
 if str(BACKEND_DIR) not in sys.path:
     sys.path.insert(0, str(BACKEND_DIR))
+
+from src.extraction.template import ExtractionTemplate, load_template
+from src.settings import DEFAULT_TEMPLATE_PATH
+
+
+@pytest.fixture(scope="session")
+def template() -> ExtractionTemplate:
+    """The default v1 template, parsed once per test session."""
+    return load_template(DEFAULT_TEMPLATE_PATH)
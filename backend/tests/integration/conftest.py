@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+from itertools import islice
+from typing import Iterator
+
+import httpx
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from app import app
+
+
+def _patch_concurrently(requests: list[tuple[str, dict]]) -> list[httpx.Response]:
+    """Issue PATCH calls against the app concurrently over ASGI."""
+
+    async def _run() -> list[httpx.Response]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return list(await asyncio.gather(*(client.patch(url, json=body) for url, body in requests)))
+
+    return asyncio.run(_run())
+
+
+@pytest.fixture(scope="session")
+def quick_client_job() -> Iterator[tuple[TestClient, str]]:
+    """One TestClient and one completed quick-mode run shared by the suite.
+
+    The quick run (parse, extract, insert) dominates integration wall time,
+    so it executes once; tests that mutate cells apply their own PATCHes and
+    assert on their own exports, which keeps them order-independent.
+    """
+    with TestClient(app) as client:
+        run_resp = client.post("/runs", json={"mode": "quick", "wait": True})
+        assert run_resp.status_code == 200
+        job = orjson.loads(run_resp.content)["job"]
+        assert job["status"] == "COMPLETED"
+        yield client, job["id"]
+
+
+@pytest.fixture(scope="session")
+def reviewed_exports(quick_client_job: tuple[TestClient, str]) -> tuple[str, bytes]:
+    """CSV text and xlsx bytes exported once after one manual and one
+    rejected review on the shared quick job.
+
+    Both parity tests assert against the same export pair, so each export
+    endpoint (and the table build behind it) runs once per session.
+    """
+    client, job_id = quick_client_job
+
+    table_resp = client.get("/results/table", params={"job_id": job_id})
+    assert table_resp.status_code == 200
+    # Only the first two reviewable cells are needed, so stop walking the
+    # payload as soon as they are found.
+    reviewable = (cell for row in orjson.loads(table_resp.content)["rows"] for cell in row["cells"] if cell.get("cell_id"))
+    cells = list(islice(reviewable, 2))
+    assert len(cells) == 2
+
+    manual_resp, reject_resp = _patch_concurrently(
+        [
+            (
+                f"/cells/{cells[0]['cell_id']}",
+                {"actor": "test", "manual_value": "manual override value", "reason": "review states"},
+            ),
+            (
+                f"/cells/{cells[1]['cell_id']}",
+                {"actor": "test", "review_state": "REJECTED", "reason": "review states"},
+            ),
+        ]
+    )
+    assert manual_resp.status_code == 200
+    assert reject_resp.status_code == 200
+    assert orjson.loads(manual_resp.content)["cell"]["review_state"] == "MANUAL_UPDATED"
+    assert orjson.loads(reject_resp.content)["cell"]["review_state"] == "REJECTED"
+
+    csv_resp = client.post("/exports/csv", json={"job_id": job_id})
+    xlsx_resp = client.post("/exports/xlsx", json={"job_id": job_id})
+    assert csv_resp.status_code == 200
+    assert xlsx_resp.status_code == 200
+
+    return csv_resp.content.decode("utf-8"), xlsx_resp.content
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.domain import ChunkBatch, DocumentRecord
+from src.parsers.html_parser import parse_html
+from src.parsers.pdf_parser import parse_pdf
+
+DATA_DIR = Path(__file__).resolve().parents[3] / "data"
+
+
+@pytest.fixture(scope="session")
+def pdf_chunks_2pages() -> ChunkBatch:
+    """First two pages of the sample PDF, parsed once per session."""
+    path = DATA_DIR / "Supply Agreement.pdf"
+    document = DocumentRecord(
+        id="doc-test-pdf",
+        identifier=path.name,
+        path=str(path),
+        source="data",
+        kind="pdf",
+    )
+    return parse_pdf(document, max_pages=2)
+
+
+@pytest.fixture(scope="session")
+def html_chunks() -> ChunkBatch:
+    """The sample HTML exhibit, parsed once per session."""
+    path = DATA_DIR / "EX-10.2.html"
+    document = DocumentRecord(
+        id="doc-test-html",
+        identifier=path.name,
+        path=str(path),
+        source="data",
+        kind="html",
+    )
+    return parse_html(document)
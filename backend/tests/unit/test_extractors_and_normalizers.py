@@ -5,9 +5,8 @@ import json
 from src.domain import DocumentRecord, TextChunk
 from src.extraction.extractor import extract_field
 from src.extraction.normalizers import normalize_currency, normalize_date
-from src.extraction.template import load_template
+from src.extraction.template import ExtractionTemplate
 from src.services.run_service import REQUIRED_V1_KEYS
-from src.settings import DEFAULT_TEMPLATE_PATH
 
 
 def _sample_doc() -> DocumentRecord:
@@ -20,14 +19,12 @@ def _sample_doc() -> DocumentRecord:
     )
 
 
-def test_template_has_required_v1_keys_in_order() -> None:
-    template = load_template(DEFAULT_TEMPLATE_PATH)
+def test_template_has_required_v1_keys_in_order(template: ExtractionTemplate) -> None:
     assert [field.key for field in template.fields] == REQUIRED_V1_KEYS
 
 
-def test_effective_date_term_combines_components() -> None:
-    template = load_template(DEFAULT_TEMPLATE_PATH)
-    field = next(f for f in template.fields if f.key == "effective_date_term")
+def test_effective_date_term_combines_components(template: ExtractionTemplate) -> None:
+    field = template.fields_by_key["effective_date_term"]
 
     chunks = [
         TextChunk(
@@ -55,9 +52,8 @@ def test_effective_date_term_combines_components() -> None:
     assert result.citation is not None
 
 
-def test_payment_delivery_terms_extractor() -> None:
-    template = load_template(DEFAULT_TEMPLATE_PATH)
-    field = next(f for f in template.fields if f.key == "payment_delivery_terms")
+def test_payment_delivery_terms_extractor(template: ExtractionTemplate) -> None:
+    field = template.fields_by_key["payment_delivery_terms"]
 
     chunks = [
         TextChunk(
@@ -75,9 +71,8 @@ def test_payment_delivery_terms_extractor() -> None:
     assert result.confidence > 0
 
 
-def test_breach_liability_extractor() -> None:
-    template = load_template(DEFAULT_TEMPLATE_PATH)
-    field = next(f for f in template.fields if f.key == "breach_liability")
+def test_breach_liability_extractor(template: ExtractionTemplate) -> None:
+    field = template.fields_by_key["breach_liability"]
 
     chunks = [
         TextChunk(